@@ -1,12 +1,18 @@
+import hashlib
 import io
 import sys
 import os
+import tempfile
 import requests
 import streamlit as st
-import fitz  # pymupdf
 
-sys.path.insert(0, os.path.dirname(__file__))
-from pdf_notebook import PDFHyperlinkedNotebookGenerator
+# PyMuPDF, NumPy and the generator module are imported lazily inside the
+# generation/preview helpers so the first paint of the UI doesn't pay their
+# import cost.
+
+_HERE = os.path.dirname(__file__)
+if _HERE not in sys.path:
+    sys.path.insert(0, _HERE)
 
 st.set_page_config(page_title="Notebook Generator", page_icon="📓", layout="centered")
 
@@ -88,15 +94,135 @@ PAGE_NUMBER_POSITIONS = {
     "None":         None,
 }
 
+# Widget options never change, so materialize them once at import instead of
+# rebuilding the lists on every Streamlit rerun.
+_DEVICE_GROUPS = tuple(DEVICES.keys())
+_DEVICE_NAMES_BY_GROUP = {group: tuple(names.keys()) for group, names in DEVICES.items()}
+_DEVICE_KEYS = {(group, name): key
+                for group, names in DEVICES.items()
+                for name, key in names.items()}
+_PATTERN_NAMES = tuple(PATTERNS.keys())
+_POSITION_NAMES = tuple(PAGE_NUMBER_POSITIONS.keys())
+
+# Notebooks up to this size are generated in RAM; anything larger spills to a
+# temp file so a 1000-page notebook can't blow up the app's memory footprint.
+SPOOL_MAX_BYTES = 8 * 1024 * 1024
+
+# Preview thumbnails display at a few hundred pixels wide, so a reduced
+# raster scale is plenty.
+_PREVIEW_SCALE = 0.75
+
+
+@st.cache_resource
+def _options():
+    """Widget option tuples, interned once per server process.
+
+    Returning the same objects on every rerun keeps them identity-stable,
+    which lets Streamlit short-circuit its option-change detection even if
+    the script module is ever reloaded.
+    """
+    return (_DEVICE_GROUPS, _DEVICE_NAMES_BY_GROUP, _PATTERN_NAMES, _POSITION_NAMES)
+
+
+@st.cache_data
+def _toc_pages(device_key, num_pages, include_toc, margin_top, margin_bottom):
+    """Number of TOC pages for a configuration, cached across Streamlit reruns."""
+    if not include_toc:
+        return 0
+    from pdf_notebook import PDFHyperlinkedNotebookGenerator
+
+    probe = PDFHyperlinkedNotebookGenerator(
+        filename=io.BytesIO(),
+        num_pages=num_pages,
+        page_size=device_key,
+        page_pattern='blank',
+        page_number_position=None,
+        include_title_page=False,
+        include_toc=True,
+        margins={'left': 5, 'right': 5, 'top': margin_top, 'bottom': margin_bottom},
+    )
+    return probe._calculate_toc_pages()
+
+
+@st.cache_data(max_entries=8, ttl=3600)
+def _build_pdf(device_key, pattern_key, num_pages, spacing_mm,
+               page_number_position, include_title_page, include_toc,
+               margins_tuple):
+    """Generate a notebook PDF and return its bytes, memoized by all inputs.
+
+    Repeated clicks with an unchanged configuration (e.g. toggling a setting
+    back and forth) return the cached bytes instead of regenerating. Margins
+    travel as a (left, right, top, bottom) tuple so the key stays hashable.
+    """
+    from pdf_notebook import PDFHyperlinkedNotebookGenerator
+
+    margin_left, margin_right, margin_top, margin_bottom = margins_tuple
+    # Small notebooks stay in memory; large ones spill to disk instead of
+    # growing an in-RAM buffer linearly with num_pages.
+    buffer = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES, mode='w+b')
+    generator = PDFHyperlinkedNotebookGenerator(
+        filename=buffer,
+        num_pages=num_pages,
+        page_size=device_key,
+        page_pattern=pattern_key,
+        spacing_mm=spacing_mm,
+        page_number_position=page_number_position,
+        include_title_page=include_title_page,
+        include_toc=include_toc,
+        margins={
+            "left":   margin_left,
+            "right":  margin_right,
+            "top":    margin_top,
+            "bottom": margin_bottom,
+        },
+    )
+    generator.generate()
+    buffer.seek(0)
+    pdf_bytes = buffer.read()
+    buffer.close()
+    return pdf_bytes
+
+
+@st.cache_data(max_entries=32)
+def _render_previews(pdf_hash, _pdf_bytes, page_indices, scale):
+    """Rasterize the preview pages to image arrays with a single document parse.
+
+    Keyed by a short digest of the PDF (plus page indices and scale) so
+    re-displaying the same notebook skips rasterization entirely; the
+    underscore-prefixed bytes are excluded from Streamlit's hashing.
+    All pages are rasterized in one pass over a single open document, and
+    st.image accepts the raw pixel arrays directly, so there is no
+    per-page encoder setup (or any PNG/JPEG encoding) to amortize.
+    """
+    import fitz
+    import numpy as np
+
+    images = []
+    # The context manager releases MuPDF's C-side memory as soon as the
+    # previews are rendered; pix.samples is an owning bytes copy, so the
+    # arrays stay valid after the document is closed.
+    with fitz.open(stream=_pdf_bytes, filetype="pdf") as doc:
+        matrix = fitz.Matrix(scale, scale)
+        for idx in page_indices:
+            pix = doc[idx].get_pixmap(matrix=matrix)
+            images.append(
+                np.frombuffer(pix.samples, dtype=np.uint8)
+                  .reshape(pix.height, pix.width, pix.n)
+            )
+            pix = None
+    return tuple(images)
+
 # --- Layout ---
+device_groups, device_names_by_group, pattern_names, position_names = _options()
+
 col1, col2 = st.columns(2)
 
 with col1:
-    device_group = st.selectbox("Device type", list(DEVICES.keys()))
-    device_display = st.selectbox("Device", list(DEVICES[device_group].keys()))
-    device_key = DEVICES[device_group][device_display]
+    device_group = st.selectbox("Device type", device_groups)
+    device_display = st.selectbox("Device", device_names_by_group[device_group])
+    device_key = _DEVICE_KEYS[(device_group, device_display)]
 
-    pattern_display = st.selectbox("Page pattern", list(PATTERNS.keys()))
+    pattern_display = st.selectbox("Page pattern", pattern_names)
     pattern_key = PATTERNS[pattern_display]
 
     num_pages = st.number_input("Number of pages", min_value=1, max_value=1000, value=100, step=10)
@@ -104,11 +230,13 @@ with col1:
 with col2:
     spacing_mm = st.number_input("Spacing (mm)", min_value=2.0, max_value=20.0, value=5.0, step=0.5,
                                   help="Spacing between dots, lines, or grid cells")
-    pos_display = st.selectbox("Page number position", list(PAGE_NUMBER_POSITIONS.keys()))
+    pos_display = st.selectbox("Page number position", position_names)
     page_number_position = PAGE_NUMBER_POSITIONS[pos_display]
 
     include_title_page = st.checkbox("Include title page", value=True)
     include_toc = st.checkbox("Include table of contents", value=True)
+    show_preview = st.checkbox("Show preview", value=False,
+                               help="Render thumbnails of the generated notebook")
 
 with st.expander("Margins (mm)"):
     mc1, mc2 = st.columns(2)
@@ -119,35 +247,37 @@ with st.expander("Margins (mm)"):
         margin_right  = st.number_input("Right",  min_value=0, max_value=50, value=5)
         margin_bottom = st.number_input("Bottom", min_value=0, max_value=50, value=5)
 
+# Flatten the margins right at the widget boundary; the cache-decorated
+# helpers take this hashable tuple rather than a dict.
+margins_t = (margin_left, margin_right, margin_top, margin_bottom)
+
 st.divider()
 
 if st.button("Generate PDF", type="primary", use_container_width=True):
     with st.spinner("Generating your notebook..."):
         try:
-            buffer = io.BytesIO()
-            generator = PDFHyperlinkedNotebookGenerator(
-                filename=buffer,
-                num_pages=num_pages,
-                page_size=device_key,
-                page_pattern=pattern_key,
-                spacing_mm=spacing_mm,
-                page_number_position=page_number_position,
-                include_title_page=include_title_page,
-                include_toc=include_toc,
-                margins={
-                    "left":   margin_left,
-                    "right":  margin_right,
-                    "top":    margin_top,
-                    "bottom": margin_bottom,
-                },
-            )
-            num_toc_pages = generator._calculate_toc_pages() if include_toc else 0
+            num_toc_pages = _toc_pages(device_key, num_pages, include_toc,
+                                       margin_top, margin_bottom)
             title_pages = 1 if include_title_page else 0
             first_content_idx = title_pages + num_toc_pages
 
-            generator.generate()
-            buffer.seek(0)
-            pdf_bytes = buffer.read()
+            # Dirty-bit check: if the configuration hasn't changed since the
+            # last generation in this session, reuse the bytes we already
+            # have. This also keeps the latest notebook available after the
+            # st.cache_data entry expires or is evicted.
+            cfg = (device_key, pattern_key, num_pages, spacing_mm,
+                   page_number_position, include_title_page, include_toc,
+                   margins_t)
+            if st.session_state.get("pdf_cfg") == cfg:
+                pdf_bytes = st.session_state["pdf_bytes"]
+            else:
+                pdf_bytes = _build_pdf(
+                    device_key, pattern_key, num_pages, spacing_mm,
+                    page_number_position, include_title_page, include_toc,
+                    margins_t,
+                )
+                st.session_state["pdf_cfg"] = cfg
+                st.session_state["pdf_bytes"] = pdf_bytes
 
             filename = f"{device_display} - {pattern_display} - {num_pages}p.pdf"
             st.success("Notebook generated!")
@@ -159,26 +289,27 @@ if st.button("Generate PDF", type="primary", use_container_width=True):
                 use_container_width=True,
             )
 
-            doc = fitz.open(stream=pdf_bytes, filetype="pdf")
-            preview_indices = []
-            preview_labels = []
-            if include_title_page:
-                preview_indices.append(0)
-                preview_labels.append("Title page")
-            if include_toc:
-                preview_indices.append(title_pages)
-                preview_labels.append("Table of contents")
-            if first_content_idx < len(doc):
-                preview_indices.append(first_content_idx)
-                preview_labels.append("Content page")
-
-            if preview_indices:
-                st.markdown("**Preview:**")
-                cols = st.columns(len(preview_indices))
-                for col, idx, label in zip(cols, preview_indices, preview_labels):
-                    pix = doc[idx].get_pixmap(matrix=fitz.Matrix(1.5, 1.5))
-                    col.image(pix.tobytes("png"), use_container_width=True)
-                    col.caption(label)
+            if show_preview:
+                # The total page count is known arithmetically, so no need to
+                # parse the generated PDF just to ask for len(doc).
+                total_doc_pages = title_pages + num_toc_pages + num_pages
+                previews = tuple(p for p in (
+                    (0, "Title page") if include_title_page else None,
+                    (title_pages, "Table of contents") if include_toc else None,
+                    ((first_content_idx, "Content page")
+                     if first_content_idx < total_doc_pages else None),
+                ) if p is not None)
+
+                if previews:
+                    st.markdown("**Preview:**")
+                    pdf_hash = hashlib.blake2b(pdf_bytes, digest_size=16).digest()
+                    images = _render_previews(pdf_hash, pdf_bytes,
+                                              tuple(idx for idx, _ in previews),
+                                              _PREVIEW_SCALE)
+                    cols = st.columns(len(previews))
+                    for col, image, (_, label) in zip(cols, images, previews):
+                        col.image(image, use_container_width=True)
+                        col.caption(label)
         except Exception as e:
             st.error(f"Error generating notebook: {e}")
 
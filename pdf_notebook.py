@@ -79,12 +79,29 @@ Generate a single device/pattern combination:
     >>> batch.generate_single('remarkable2', 'dots')
 """
 
+import concurrent.futures
 import os
+import sys
+from functools import cached_property
+
+# Only the lightweight ReportLab pieces are imported at module level (the
+# class body needs mm and the page-size constants); the canvas, font
+# machinery and numpy are imported lazily inside the methods that use them
+# so `import pdf_notebook` stays cheap for callers that never generate.
 from reportlab.lib.pagesizes import A4, letter, A5, legal
-from reportlab.pdfgen import canvas
 from reportlab.lib.units import mm
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
+from reportlab import rl_config
+
+# ReportLab validates every attribute assignment on its drawing objects when
+# shapeChecking is on; with thousands of pattern primitives per page that
+# adds up, so skip it in normal runs. Set NOTEBOOK_DEBUG to re-enable the
+# checks while debugging drawing code.
+if not os.environ.get('NOTEBOOK_DEBUG'):
+    rl_config.shapeChecking = 0
+    # Skip the per-document timestamp/ID generation as well; identical
+    # inputs then produce byte-identical PDFs, which keeps the app's
+    # preview cache honest.
+    rl_config.invariant = 1
 
 
 class PDFHyperlinkedNotebookGenerator:
@@ -167,9 +184,13 @@ class PDFHyperlinkedNotebookGenerator:
         'legal': 'Legal',
     }
     
-    VALID_PAGE_POSITIONS = ['upper-right', 'upper-middle', 'lower-right', 
-                           'lower-middle', 'lower-left', None]
-    VALID_PATTERNS = ['dots', 'lines', 'grid', 'blank']
+    VALID_PAGE_POSITIONS = frozenset({'upper-right', 'upper-middle', 'lower-right',
+                                      'lower-middle', 'lower-left', None})
+    VALID_PATTERNS = frozenset({'dots', 'lines', 'grid', 'blank'})
+    # Ordered forms of the above, kept for readable error messages
+    VALID_PAGE_POSITIONS_LIST = ['upper-right', 'upper-middle', 'lower-right',
+                                 'lower-middle', 'lower-left', None]
+    VALID_PATTERNS_LIST = ['dots', 'lines', 'grid', 'blank']
     
     # Default settings
     DEFAULT_MARGINS = {
@@ -182,13 +203,15 @@ class PDFHyperlinkedNotebookGenerator:
     DEFAULT_SPACING = 5         # mm
     DEFAULT_DOT_RADIUS = 0.5    # points
     DEFAULT_TOC_LINE_SPACING = 8  # mm
+    DEFAULT_WRITE_BUFFER_SIZE = 1 << 20  # bytes
     
     def __init__(self, filename, spacing_mm=None, num_pages=1, page_size=A4, 
                  dot_radius=None, page_number_position='lower-left',
                  margins=None, left_margin_mm=None, right_margin_mm=None, 
                  top_margin_mm=None, bottom_margin_mm=None, 
                  include_title_page=True, include_toc=True,
-                 toc_line_spacing_mm=None, page_pattern='dots'):
+                 toc_line_spacing_mm=None, page_pattern='dots',
+                 write_buffer_size=None):
         """
         Initialize the PDF Notebook Generator.
         
@@ -226,6 +249,9 @@ class PDFHyperlinkedNotebookGenerator:
             Line spacing for TOC entries in millimeters (default: 8mm)
         page_pattern : str
             Pattern to draw: 'dots', 'lines', 'grid', or 'blank' (default: 'dots')
+        write_buffer_size : int, optional
+            Write-buffer size in bytes used when filename is a path
+            (default: 1 MiB)
         """
         self.filename = filename
         self.num_pages = num_pages
@@ -254,17 +280,13 @@ class PDFHyperlinkedNotebookGenerator:
             if bottom_margin_mm is not None:
                 self.margins['bottom'] = bottom_margin_mm
         
-        # Fill in any missing margins with defaults
+        # Fill in any missing margins with defaults. The margins dict is the
+        # single source of truth; the *_margin_mm and *_margin attributes are
+        # derived views (see the properties below).
         for key in ['left', 'right', 'top', 'bottom']:
             if key not in self.margins:
                 self.margins[key] = self.DEFAULT_MARGINS[key]
-        
-        # Set individual margin attributes for convenience
-        self.left_margin_mm = self.margins['left']
-        self.right_margin_mm = self.margins['right']
-        self.top_margin_mm = self.margins['top']
-        self.bottom_margin_mm = self.margins['bottom']
-        
+
         # Store original page size for display purposes
         self.original_page_size_str = page_size if isinstance(page_size, str) else None
         
@@ -275,23 +297,58 @@ class PDFHyperlinkedNotebookGenerator:
         self.page_size = self._resolve_page_size(page_size)
         self.page_width, self.page_height = self.page_size
         
+        from reportlab.pdfgen import canvas
+        from reportlab.pdfbase import pdfmetrics
+
         # Register fonts
         self.font_name = self._register_sans_font()
         self.serif_font_name, self.serif_font_embedded = self._register_serif_font()
+
+        # The TOC navigation labels are constant, so measure them once
+        # instead of walking the font metrics on every TOC page.
+        self._nav_widths = {
+            label: pdfmetrics.stringWidth(label, self.font_name, 8)
+            for label in ("Previous", "Cover", "Next")
+        }
         
         # Convert measurements to points
         self.spacing = self.spacing_mm * mm
-        self.left_margin = self.left_margin_mm * mm
-        self.right_margin = self.right_margin_mm * mm
-        self.top_margin = self.top_margin_mm * mm
-        self.bottom_margin = self.bottom_margin_mm * mm
-        
-        # State tracking
+
+        # Pattern coordinates are identical on every content page; they are
+        # computed lazily on first draw and invalidated if margins change.
+        self._pattern_cache = None
+
+        # TOC pagination depends only on page height, margins and line
+        # spacing; compute it once here instead of in every consumer.
+        self._compute_toc_layout()
+
+        # State tracking. The TOC page map is indexed by content page number
+        # (1-based, dense) and stores the 1-based TOC page index, 0 meaning
+        # "no TOC entry"; a flat list avoids dict hashing in the TOC loop.
         self.actual_page_num = 1
-        self.toc_page_map = {}
-        
-        # Initialize canvas
-        self.canvas = canvas.Canvas(self.filename, pagesize=self.page_size)
+        self.toc_page_map = [0] * (self.num_pages + 1)
+        # Resolved destination names per content page, filled in after the
+        # TOC is laid out; None where a page has no TOC entry.
+        self._page_link_targets = [None] * (self.num_pages + 1)
+        
+        # Initialize canvas. Page streams are zlib-compressed as they are
+        # finished, which keeps both the in-memory document and the output
+        # file small for large page counts. Path filenames are opened here
+        # with a large write buffer so saving issues few syscalls; file-like
+        # filenames are passed through and stay owned by the caller.
+        self._owns_output = isinstance(self.filename, str)
+        if self._owns_output:
+            buffer_size = (write_buffer_size if write_buffer_size is not None
+                           else self.DEFAULT_WRITE_BUFFER_SIZE)
+            self._output = open(self.filename, 'wb', buffering=buffer_size)
+        else:
+            self._output = self.filename
+        self.canvas = canvas.Canvas(self._output, pagesize=self.page_size,
+                                    pageCompression=1)
+
+        # Prebuilt page-number operator prefix; filled in lazily on first use
+        # because the internal font name comes from the canvas document.
+        self._pageno_prefix = None
     
     def get_margins(self):
         """
@@ -332,30 +389,75 @@ class PDFHyperlinkedNotebookGenerator:
         if bottom is not None:
             self.margins['bottom'] = bottom
         
-        # Update individual attributes
-        self.left_margin_mm = self.margins['left']
-        self.right_margin_mm = self.margins['right']
-        self.top_margin_mm = self.margins['top']
-        self.bottom_margin_mm = self.margins['bottom']
-        
-        # Update point values
-        self.left_margin = self.left_margin_mm * mm
-        self.right_margin = self.right_margin_mm * mm
-        self.top_margin = self.top_margin_mm * mm
-        self.bottom_margin = self.bottom_margin_mm * mm
-    
+        # Invalidate the cached point values so they are re-derived from the
+        # updated margins dict on next access
+        for attr in ('left_margin', 'right_margin', 'top_margin',
+                     'bottom_margin', '_grid_end_x'):
+            self.__dict__.pop(attr, None)
+
+        # Refresh the precomputed pattern coordinates and TOC layout
+        self._pattern_cache = None
+        self._compute_toc_layout()
+
+    # -- Derived margin views ------------------------------------------------
+    # The margins dict holds the values in mm; these expose the mm values as
+    # attributes and cache the point conversions per instance.
+
+    @property
+    def left_margin_mm(self):
+        return self.margins['left']
+
+    @property
+    def right_margin_mm(self):
+        return self.margins['right']
+
+    @property
+    def top_margin_mm(self):
+        return self.margins['top']
+
+    @property
+    def bottom_margin_mm(self):
+        return self.margins['bottom']
+
+    @cached_property
+    def left_margin(self):
+        return self.margins['left'] * mm
+
+    @cached_property
+    def right_margin(self):
+        return self.margins['right'] * mm
+
+    @cached_property
+    def top_margin(self):
+        return self.margins['top'] * mm
+
+    @cached_property
+    def bottom_margin(self):
+        return self.margins['bottom'] * mm
+
+    @cached_property
+    def _grid_end_x(self):
+        """Right edge of the centered grid pattern, in points.
+
+        Used to align grid-pattern page numbers; depends only on the page
+        geometry so it is computed once and invalidated by set_margins.
+        """
+        available_width = self.page_width - self.left_margin - self.right_margin
+        grid_width = int(available_width / self.spacing) * self.spacing
+        return self.left_margin + (available_width - grid_width) / 2 + grid_width
+
     def _validate_inputs(self):
         """Validate input parameters."""
         if self.page_number_position not in self.VALID_PAGE_POSITIONS:
             raise ValueError(
                 f"Invalid page_number_position: {self.page_number_position}. "
-                f"Must be one of {self.VALID_PAGE_POSITIONS}"
+                f"Must be one of {self.VALID_PAGE_POSITIONS_LIST}"
             )
-        
+
         if self.page_pattern not in self.VALID_PATTERNS:
             raise ValueError(
                 f"Invalid page_pattern: {self.page_pattern}. "
-                f"Must be one of {self.VALID_PATTERNS}"
+                f"Must be one of {self.VALID_PATTERNS_LIST}"
             )
     
     def _resolve_page_size(self, page_size):
@@ -371,8 +473,21 @@ class PDFHyperlinkedNotebookGenerator:
                 )
         return page_size
     
-    def _register_sans_font(self):
-        """Register Arial font, fallback to Helvetica."""
+    # Font registration results, cached per process. Registered fonts live in
+    # pdfmetrics globals for the process lifetime, so the filesystem walk and
+    # TTF parsing only need to happen for the first generator instance.
+    _sans_font_cache = None
+    _serif_font_cache = None
+
+    @classmethod
+    def _register_sans_font(cls):
+        """Register Arial font, fallback to Helvetica (cached per process)."""
+        if cls._sans_font_cache is not None:
+            return cls._sans_font_cache
+
+        from reportlab.pdfbase import pdfmetrics
+        from reportlab.pdfbase.ttfonts import TTFont
+
         font_name = "Helvetica"
         try:
             arial_paths = [
@@ -381,7 +496,7 @@ class PDFHyperlinkedNotebookGenerator:
                 "/usr/share/fonts/truetype/msttcorefonts/arial.ttf",
                 "/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf"
             ]
-            
+
             for path in arial_paths:
                 if os.path.exists(path):
                     pdfmetrics.registerFont(TTFont('Arial', path))
@@ -389,10 +504,18 @@ class PDFHyperlinkedNotebookGenerator:
                     break
         except:
             pass
+        cls._sans_font_cache = font_name
         return font_name
-    
-    def _register_serif_font(self):
-        """Register EB Garamond font, fallback to Helvetica."""
+
+    @classmethod
+    def _register_serif_font(cls):
+        """Register EB Garamond font, fallback to Helvetica (cached per process)."""
+        if cls._serif_font_cache is not None:
+            return cls._serif_font_cache
+
+        from reportlab.pdfbase import pdfmetrics
+        from reportlab.pdfbase.ttfonts import TTFont
+
         serif_font_name = "Helvetica"
         serif_font_embedded = False
         try:
@@ -406,7 +529,7 @@ class PDFHyperlinkedNotebookGenerator:
                 "/usr/share/fonts/truetype/ebgaramond/EBGaramond-Regular.ttf",
                 "/usr/share/fonts/opentype/eb-garamond/EBGaramond-Regular.otf",
             ]
-            
+
             for path in garamond_paths:
                 expanded_path = os.path.expanduser(path)
                 if os.path.exists(expanded_path):
@@ -416,25 +539,52 @@ class PDFHyperlinkedNotebookGenerator:
                     break
         except:
             pass
-        return serif_font_name, serif_font_embedded
+        cls._serif_font_cache = (serif_font_name, serif_font_embedded)
+        return cls._serif_font_cache
     
     def _get_display_name(self):
         """Get display name for the page size."""
         if self.original_page_size_str:
-            return self.DEVICE_DISPLAY_NAMES.get(
-                self.original_page_size_str.lower(),
-                self.original_page_size_str
-            )
+            names = self.DEVICE_DISPLAY_NAMES
+            # Device keys are already lowercase, so only lowercase on a miss
+            return (names.get(self.original_page_size_str)
+                    or names.get(self.original_page_size_str.lower(),
+                                 self.original_page_size_str))
         return 'Custom Size'
     
+    # The title page is fully determined by the page geometry, display name
+    # and fonts, so the rendered content-stream operators are cached at class
+    # level and spliced into later documents (the batch generator redraws the
+    # same title page once per pattern). Each entry stores the operator slice
+    # plus the internal font names it references, so a hit is only reused
+    # when the new document resolves the fonts to the same names.
+    _title_page_cache = {}
+
     def _create_title_page(self):
         """Create the title page."""
         c = self.canvas
-        
-        # Bookmark the title page
+
+        # Bookmarks stay outside the cached slice; they carry per-document
+        # destinations.
         c.bookmarkPage("title_page")
         c.bookmarkPage(f"page_num_{self.actual_page_num}")
-        
+
+        fonts_used = (self.serif_font_name, self.font_name, "Helvetica-Oblique")
+        cache_key = (self.page_width, self.page_height, self.left_margin,
+                     self.right_margin, self.top_margin,
+                     self._get_display_name()) + fonts_used
+        cached = self._title_page_cache.get(cache_key)
+        if cached is not None:
+            ops, internal_names = cached
+            # Registering the fonts here also adds them to the document's
+            # resources, which the cached operators rely on.
+            if [c._doc.getInternalFontName(f) for f in fonts_used] == internal_names:
+                c._code.extend(ops)
+                c.showPage()
+                self.actual_page_num += 1
+                return
+        code_start = len(c._code)
+
         # Add "Linked Workbook" header at the top
         header_y = self.page_height - self.top_margin - (20 * mm)
         c.setFont(self.serif_font_name, 16)
@@ -450,40 +600,57 @@ class PDFHyperlinkedNotebookGenerator:
         c.setLineWidth(0.5)
         c.setStrokeColorRGB(0.7, 0.7, 0.7)
         c.setFillColorRGB(0.3, 0.3, 0.3)
-        c.setFont(self.font_name, 7)
-        
+
+        # The field ruling goes into one path and the labels into one text
+        # object, so the page carries a single stroke and a single BT/ET
+        # block instead of one per field.
+        rules = c.beginPath()
+        labels = c.beginText()
+        labels.setFont(self.font_name, 7)
+
         # Title field
-        c.line(label_x, y_position, label_x + line_length, y_position)
+        rules.moveTo(label_x, y_position)
+        rules.lineTo(label_x + line_length, y_position)
         y_position -= 12
-        c.drawString(label_x, y_position, "Title")
+        labels.setTextOrigin(label_x, y_position)
+        labels.textOut("Title")
         y_position -= 28
-        
+
         # Owner field
-        c.line(label_x, y_position, label_x + line_length, y_position)
+        rules.moveTo(label_x, y_position)
+        rules.lineTo(label_x + line_length, y_position)
         y_position -= 12
-        c.drawString(label_x, y_position, "Owner")
+        labels.setTextOrigin(label_x, y_position)
+        labels.textOut("Owner")
         y_position -= 28
-        
+
         # Description field (3 lines)
-        c.line(label_x, y_position, label_x + line_length, y_position)
-        y_position -= 20
-        c.line(label_x, y_position, label_x + line_length, y_position)
-        y_position -= 20
-        c.line(label_x, y_position, label_x + line_length, y_position)
-        y_position -= 12
-        c.drawString(label_x, y_position, "Description")
+        for _ in range(3):
+            rules.moveTo(label_x, y_position)
+            rules.lineTo(label_x + line_length, y_position)
+            y_position -= 20
+        y_position += 8
+        labels.setTextOrigin(label_x, y_position)
+        labels.textOut("Description")
         y_position -= 38
-        
+
         # Date From field
-        c.line(label_x, y_position, label_x + line_length, y_position)
+        rules.moveTo(label_x, y_position)
+        rules.lineTo(label_x + line_length, y_position)
         y_position -= 12
-        c.drawString(label_x, y_position, "Date From")
+        labels.setTextOrigin(label_x, y_position)
+        labels.textOut("Date From")
         y_position -= 28
-        
+
         # Date To field
-        c.line(label_x, y_position, label_x + line_length, y_position)
+        rules.moveTo(label_x, y_position)
+        rules.lineTo(label_x + line_length, y_position)
         y_position -= 12
-        c.drawString(label_x, y_position, "Date To")
+        labels.setTextOrigin(label_x, y_position)
+        labels.textOut("Date To")
+
+        c.drawPath(rules, stroke=1, fill=0)
+        c.drawText(labels)
         
         # Footer text
         size_display = self._get_display_name()
@@ -492,59 +659,76 @@ class PDFHyperlinkedNotebookGenerator:
         c.setFillColorRGB(0.4, 0.4, 0.4)
         c.drawString(self.left_margin, 10 * mm, template_text)
         
-        # Reset styles
-        c.setFillColorRGB(0, 0, 0)
-        c.setStrokeColorRGB(0, 0, 0)
-        c.setLineWidth(1)
-        
+        self._title_page_cache[cache_key] = (
+            list(c._code[code_start:]),
+            [c._doc.getInternalFontName(f) for f in fonts_used],
+        )
+
         c.showPage()
         self.actual_page_num += 1
-    
-    def _calculate_toc_pages(self):
-        """Calculate number of TOC pages needed."""
+
+    def _compute_toc_layout(self):
+        """Precompute TOC pagination shared by layout and summary code.
+
+        Sets the per-page entry capacities and the resulting number of TOC
+        pages; called from __init__ and whenever margins change.
+        """
         toc_line_spacing = self.toc_line_spacing_mm * mm
         toc_top_spacing = 20 + (10 * mm)
         toc_header_spacing = 20
-        
+
         first_page_available_height = (
-            self.page_height - self.top_margin - self.bottom_margin - 
+            self.page_height - self.top_margin - self.bottom_margin -
             (5 * mm) - (20 * mm) - toc_header_spacing
         )
         other_page_available_height = (
             self.page_height - self.top_margin - self.bottom_margin - toc_top_spacing
         )
-        
-        first_page_entries = int(first_page_available_height / toc_line_spacing)
-        entries_per_other_page = int(other_page_available_height / toc_line_spacing)
-        
-        if self.num_pages <= first_page_entries:
-            return 1
+
+        self._toc_first_entries = int(first_page_available_height / toc_line_spacing)
+        self._toc_other_entries = int(other_page_available_height / toc_line_spacing)
+
+        if self.num_pages <= self._toc_first_entries:
+            self._toc_num_pages = 1
         else:
-            remaining_entries = self.num_pages - first_page_entries
-            return 1 + ((remaining_entries + entries_per_other_page - 1) // 
-                       entries_per_other_page)
-    
+            remaining_entries = self.num_pages - self._toc_first_entries
+            self._toc_num_pages = 1 + ((remaining_entries + self._toc_other_entries - 1) //
+                                       self._toc_other_entries)
+
+    def _calculate_toc_pages(self):
+        """Calculate number of TOC pages needed."""
+        return self._toc_num_pages
+
+    # TOC entry labels depend only on the page count, not the device, so a
+    # batch run over many page sizes formats them once per process.
+    _toc_labels_cache = {}
+
+    @classmethod
+    def _toc_labels(cls, num_pages):
+        """Return the cached list of TOC entry labels for num_pages."""
+        labels = cls._toc_labels_cache.get(num_pages)
+        if labels is None:
+            labels = cls._toc_labels_cache[num_pages] = [
+                str(n) for n in range(1, num_pages + 1)
+            ]
+        return labels
+
     def _create_toc(self):
         """Create the table of contents."""
+        import numpy as np
+
         c = self.canvas
         toc_line_spacing = self.toc_line_spacing_mm * mm
         toc_top_spacing = 20 + (10 * mm)
         toc_header_spacing = 20
-        
-        first_page_available_height = (
-            self.page_height - self.top_margin - self.bottom_margin - 
-            (5 * mm) - (20 * mm) - toc_header_spacing
-        )
-        other_page_available_height = (
-            self.page_height - self.top_margin - self.bottom_margin - toc_top_spacing
-        )
-        
-        first_page_entries = int(first_page_available_height / toc_line_spacing)
-        entries_per_other_page = int(other_page_available_height / toc_line_spacing)
-        
-        num_toc_pages = self._calculate_toc_pages()
+
+        first_page_entries = self._toc_first_entries
+        entries_per_other_page = self._toc_other_entries
+
+        num_toc_pages = self._toc_num_pages
         first_content_page_num = self.actual_page_num + num_toc_pages
-        
+        all_labels = self._toc_labels(self.num_pages)
+
         entry_idx = 0
         for toc_page_idx in range(num_toc_pages):
             current_toc_page_num = self.actual_page_num
@@ -569,44 +753,57 @@ class PDFHyperlinkedNotebookGenerator:
                 y_pos = self.page_height - self.top_margin - toc_top_spacing
                 entries_this_page = entries_per_other_page
             
-            # Draw TOC entries
-            for _ in range(entries_this_page):
-                if entry_idx >= self.num_pages:
-                    break
-                
-                dot_page_num = entry_idx + 1
-                display_page_num = entry_idx + 1
-                self.toc_page_map[dot_page_num] = toc_page_key
-                
-                # Page number
-                c.setFont(self.font_name, 8)
-                c.setFillColorRGB(0, 0, 0)
-                page_num_x = self.page_width - self.right_margin + (2 * mm)
-                c.drawRightString(page_num_x, y_pos + 5, str(display_page_num))
-                
-                # Line for entry
-                line_start = self.left_margin
-                line_end = page_num_x + 2
-                c.line(line_start, y_pos, line_end, y_pos)
-                
-                # Clickable link
-                link_rect = (line_start, y_pos - 5, page_num_x, 
-                           y_pos + toc_line_spacing - 5)
-                c.linkRect("", f"page_{dot_page_num}", link_rect, relative=0)
-                
-                y_pos -= toc_line_spacing
-                entry_idx += 1
+            # Draw TOC entries in batched passes over precomputed per-entry
+            # arrays: one text object for all page numbers, one path for all
+            # underlines, one loop of link annotations. Each pass touches a
+            # single kind of data so no per-entry arithmetic is interleaved
+            # with the drawing calls.
+            entries_this_page = min(entries_this_page, self.num_pages - entry_idx)
+            c.setFillColorRGB(0, 0, 0)
+            page_num_x = self.page_width - self.right_margin + (2 * mm)
+            line_start = self.left_margin
+            line_end = page_num_x + 2
+
+            ys = (y_pos - np.arange(entries_this_page) * toc_line_spacing).tolist()
+            labels = all_labels[entry_idx:entry_idx + entries_this_page]
+
+            text = c.beginText()
+            text.setFont(self.font_name, 8)
+            for label, y in zip(labels, ys):
+                label_width = c.stringWidth(label, self.font_name, 8)
+                text.setTextOrigin(page_num_x - label_width, y + 5)
+                text.textOut(label)
+            c.drawText(text)
+
+            underlines = c.beginPath()
+            for y in ys:
+                underlines.moveTo(line_start, y)
+                underlines.lineTo(line_end, y)
+            c.drawPath(underlines, stroke=1, fill=0)
+
+            rect_top_offset = toc_line_spacing - 5
+            for i, y in enumerate(ys):
+                dot_page_num = entry_idx + i + 1
+                self.toc_page_map[dot_page_num] = toc_page_idx + 1
+                c.linkRect("", f"page_{dot_page_num}",
+                           (line_start, y - 5, page_num_x, y + rect_top_offset),
+                           relative=0)
+            entry_idx += entries_this_page
             
             # Navigation links
             self._add_toc_navigation(toc_page_idx, num_toc_pages, current_toc_page_num)
-            
-            c.setFillColorRGB(0, 0, 0)
-            c.setStrokeColorRGB(0, 0, 0)
-            c.setLineWidth(1)
-            
+
+            # No trailing color/linewidth resets: showPage starts the next
+            # page from the default graphics state anyway.
             c.showPage()
             self.actual_page_num += 1
-    
+
+        # Resolve the page-number link destinations once, so the content
+        # pages don't rebuild the bookmark string per page.
+        self._page_link_targets = [
+            f"toc_page_{idx}" if idx else None for idx in self.toc_page_map
+        ]
+
     def _add_toc_navigation(self, toc_page_idx, num_toc_pages, current_toc_page_num):
         """Add navigation links at bottom of TOC page."""
         c = self.canvas
@@ -619,7 +816,7 @@ class PDFHyperlinkedNotebookGenerator:
             prev_text = "Previous"
             prev_x = self.left_margin
             c.drawString(prev_x, nav_y_position, prev_text)
-            text_width = c.stringWidth(prev_text, self.font_name, 8)
+            text_width = self._nav_widths[prev_text]
             link_rect = (prev_x - 2, nav_y_position - 2, 
                         prev_x + text_width + 2, nav_y_position + 12)
             c.linkRect("", f"page_num_{current_toc_page_num - 1}", 
@@ -628,7 +825,7 @@ class PDFHyperlinkedNotebookGenerator:
         # Cover link
         if self.include_title_page:
             cover_text = "Cover"
-            cover_width = c.stringWidth(cover_text, self.font_name, 8)
+            cover_width = self._nav_widths[cover_text]
             cover_x = (self.page_width - cover_width) / 2
             c.drawString(cover_x, nav_y_position, cover_text)
             link_rect = (cover_x - 2, nav_y_position - 2, 
@@ -638,7 +835,7 @@ class PDFHyperlinkedNotebookGenerator:
         # Next link
         if toc_page_idx < num_toc_pages - 1:
             next_text = "Next"
-            next_width = c.stringWidth(next_text, self.font_name, 8)
+            next_width = self._nav_widths[next_text]
             next_x = self.page_width - self.right_margin - next_width
             c.drawString(next_x, nav_y_position, next_text)
             link_rect = (next_x - 2, nav_y_position - 2, 
@@ -646,71 +843,159 @@ class PDFHyperlinkedNotebookGenerator:
             c.linkRect("", f"page_num_{current_toc_page_num + 1}", 
                       link_rect, relative=0)
     
-    def _draw_dots_pattern(self):
-        """Draw dot grid pattern."""
-        c = self.canvas
-        x = self.left_margin
-        while x <= self.page_width - self.right_margin:
-            y = self.bottom_margin
-            while y <= self.page_height - self.top_margin:
-                c.circle(x, y, self.dot_radius, stroke=0, fill=1)
-                y += self.spacing
-            x += self.spacing
-    
-    def _draw_lines_pattern(self):
-        """Draw horizontal lines pattern."""
-        c = self.canvas
-        c.setLineWidth(0.5)
-        c.setStrokeColorRGB(0.7, 0.7, 0.7)
-        
-        y = self.bottom_margin
-        while y <= self.page_height - self.top_margin:
-            c.line(self.left_margin, y, self.page_width - self.right_margin, y)
-            y += self.spacing
-        
-        c.setStrokeColorRGB(0, 0, 0)
-        c.setLineWidth(1)
-    
-    def _draw_grid_pattern(self):
-        """Draw grid pattern."""
-        c = self.canvas
-        c.setLineWidth(0.5)
-        c.setStrokeColorRGB(0.7, 0.7, 0.7)
-        
+    # Dot-grid coordinates are fully determined by the page geometry, so
+    # instances sharing a device/margin/spacing combination (the common case
+    # in batch mode) can share one computed grid.
+    _dot_grid_cache = {}
+
+    def _compute_dot_grid(self):
+        """Compute the dot-grid coordinates in points as a list of (x, y).
+
+        The coordinate counts are derived up front (like the grid pattern
+        does) so no accumulated floating-point drift can add or drop a
+        trailing row of dots, and the full product is expanded with
+        np.meshgrid so all the coordinate arithmetic happens in C. Results
+        are cached per geometry so dense grids are only enumerated once per
+        process.
+        """
+        key = (self.left_margin, self.right_margin, self.bottom_margin,
+               self.top_margin, self.page_width, self.page_height,
+               self.spacing)
+        cached = self._dot_grid_cache.get(key)
+        if cached is None:
+            import numpy as np
+
+            num_x = int((self.page_width - self.right_margin - self.left_margin)
+                        / self.spacing) + 1
+            num_y = int((self.page_height - self.top_margin - self.bottom_margin)
+                        / self.spacing) + 1
+            xs = self.left_margin + np.arange(num_x) * self.spacing
+            ys = self.bottom_margin + np.arange(num_y) * self.spacing
+            xx, yy = np.meshgrid(xs, ys)
+            coords = np.column_stack((xx.ravel(), yy.ravel()))
+            cached = self._dot_grid_cache[key] = coords.tolist()
+        return cached
+
+    def _compute_line_segments(self):
+        """Compute the horizontal ruling as (x0, y0, x1, y1) segments."""
+        import numpy as np
+
+        left = self.left_margin
+        bottom = self.bottom_margin
+        right_edge = self.page_width - self.right_margin
+        top_edge = self.page_height - self.top_margin
+        spacing = self.spacing
+
+        num_lines = int((top_edge - bottom) / spacing) + 1
+        ys = (bottom + np.arange(num_lines) * spacing).tolist()
+        return [(left, y, right_edge, y) for y in ys]
+
+    def _compute_grid_segments(self):
+        """Compute the centered grid ruling as (x0, y0, x1, y1) segments."""
+        import numpy as np
+
+        spacing = self.spacing
         available_width = self.page_width - self.left_margin - self.right_margin
         available_height = self.page_height - self.top_margin - self.bottom_margin
-        
-        num_squares_horizontal = int(available_width / self.spacing)
-        num_squares_vertical = int(available_height / self.spacing)
-        
-        grid_width = num_squares_horizontal * self.spacing
-        grid_height = num_squares_vertical * self.spacing
-        
+
+        num_squares_horizontal = int(available_width / spacing)
+        num_squares_vertical = int(available_height / spacing)
+
+        grid_width = num_squares_horizontal * spacing
+        grid_height = num_squares_vertical * spacing
+
         grid_start_x = self.left_margin + (available_width - grid_width) / 2
         grid_start_y = self.bottom_margin + (available_height - grid_height) / 2
-        
-        # Horizontal lines
-        for i in range(num_squares_vertical + 1):
-            y = grid_start_y + (i * self.spacing)
-            c.line(grid_start_x, y, grid_start_x + grid_width, y)
-        
-        # Vertical lines
-        for i in range(num_squares_horizontal + 1):
-            x = grid_start_x + (i * self.spacing)
-            c.line(x, grid_start_y, x, grid_start_y + grid_height)
-        
-        c.setStrokeColorRGB(0, 0, 0)
-        c.setLineWidth(1)
-    
+        grid_end_x = grid_start_x + grid_width
+        grid_end_y = grid_start_y + grid_height
+
+        ys = (grid_start_y + np.arange(num_squares_vertical + 1) * spacing).tolist()
+        xs = (grid_start_x + np.arange(num_squares_horizontal + 1) * spacing).tolist()
+        return ([(grid_start_x, y, grid_end_x, y) for y in ys] +
+                [(x, grid_start_y, x, grid_end_y) for x in xs])
+
+    def _compute_pattern_points(self):
+        """Return the coordinate data for the configured page pattern.
+
+        Dots yield a list of (x, y) pairs; lines and grid yield a list of
+        line segments; blank yields None. The result is cached on the
+        instance (and invalidated by set_margins) so the geometry is
+        computed once per notebook regardless of page count.
+        """
+        if self._pattern_cache is None:
+            if self.page_pattern == 'dots':
+                self._pattern_cache = self._compute_dot_grid()
+            elif self.page_pattern == 'lines':
+                self._pattern_cache = self._compute_line_segments()
+            elif self.page_pattern == 'grid':
+                self._pattern_cache = self._compute_grid_segments()
+        return self._pattern_cache
+
+    # Bezier circle constant: control-point distance for a quarter-circle
+    # arc, as used by ReportLab's own circle approximation.
+    _BEZIER_ARC_K = 0.5523
+
+    def _emit_pattern_points(self, points):
+        """Emit precomputed pattern coordinates as raw content-stream ops.
+
+        The operators for every dot/segment are known exactly, so they are
+        formatted here and appended to the content stream in one chunk,
+        bypassing the per-primitive path API. Dots reuse a circle outline
+        precomputed once at the origin and placed per dot with a translate;
+        line segments accumulate into a single stroked path.
+        """
+        c = self.canvas
+        if self.page_pattern == 'dots':
+            r = self.dot_radius
+            k = r * self._BEZIER_ARC_K
+            circle_ops = (
+                '%.3f 0 m '
+                '%.3f %.3f %.3f %.3f 0 %.3f c '
+                '%.3f %.3f %.3f %.3f %.3f 0 c '
+                '%.3f %.3f %.3f %.3f 0 %.3f c '
+                '%.3f %.3f %.3f %.3f %.3f 0 c h f'
+                % (r,
+                   r, k, k, r, r,
+                   -k, r, -r, k, -r,
+                   -r, -k, -k, -r, -r,
+                   k, -r, r, -k, r)
+            )
+            c._code.append('\n'.join(
+                'q 1 0 0 1 %.2f %.2f cm %s Q' % (x, y, circle_ops)
+                for x, y in points))
+        else:
+            c.setLineWidth(0.5)
+            c.setStrokeColorRGB(0.7, 0.7, 0.7)
+
+            c._code.append('\n'.join(
+                '%.2f %.2f m %.2f %.2f l' % seg for seg in points) + '\nS')
+
     def _draw_page_pattern(self):
         """Draw the specified pattern on the current page."""
-        if self.page_pattern == 'dots':
-            self._draw_dots_pattern()
-        elif self.page_pattern == 'lines':
-            self._draw_lines_pattern()
-        elif self.page_pattern == 'grid':
-            self._draw_grid_pattern()
-        # 'blank' draws nothing
+        points = self._compute_pattern_points()
+        if points is not None:
+            self._emit_pattern_points(points)
+
+    PATTERN_FORM_NAME = "page_pattern"
+
+    def _create_pattern_form(self):
+        """Serialize the page pattern once as a reusable Form XObject.
+
+        The pattern is identical on every content page, so its drawing
+        operators are emitted into a single form; each page then references
+        it with one Do operator instead of re-serializing thousands of
+        drawing calls per page. For dots this means the whole grid — itself
+        a single filled path — is serialized exactly once per document.
+        Returns True if a form was created.
+        """
+        if self.page_pattern == 'blank':
+            return False
+        c = self.canvas
+        c.beginForm(self.PATTERN_FORM_NAME, lowerx=0, lowery=0,
+                    upperx=self.page_width, uppery=self.page_height)
+        self._draw_page_pattern()
+        c.endForm()
+        return True
     
     def _add_page_number(self, display_page_num):
         """Add page number to the current page."""
@@ -719,22 +1004,15 @@ class PDFHyperlinkedNotebookGenerator:
         
         c = self.canvas
         font_size = 18  # Increased from 14
-        c.setFont(self.font_name, font_size)
-        c.setFillColorRGB(0.55, 0.55, 0.55)
         page_num_text = str(display_page_num)
         text_width = c.stringWidth(page_num_text, self.font_name, font_size)
-        
+
         page_num_bottom = 11 * mm
         right_offset = 3 * mm  # Offset to move page number slightly to the right
-        
+
         # Calculate position based on setting
         if self.page_pattern == 'grid' and self.page_number_position == 'lower-right':
-            available_width = self.page_width - self.left_margin - self.right_margin
-            num_squares_horizontal = int(available_width / self.spacing)
-            grid_width = num_squares_horizontal * self.spacing
-            grid_start_x = self.left_margin + (available_width - grid_width) / 2
-            grid_end_x = grid_start_x + grid_width
-            x_pos = grid_end_x - text_width - (3 * mm) + right_offset
+            x_pos = self._grid_end_x - text_width - (3 * mm) + right_offset
             y_pos = page_num_bottom
         elif self.page_number_position == 'lower-left':
             x_pos = self.left_margin + right_offset
@@ -753,93 +1031,152 @@ class PDFHyperlinkedNotebookGenerator:
             y_pos = self.page_height - self.top_margin / 2 - 10
         else:
             return
-        
-        c.drawString(x_pos, y_pos, page_num_text)
-        
-        c.setFillColorRGB(0, 0, 0)
-        c.setStrokeColorRGB(0, 0, 0)
-        c.setLineWidth(1)
-        
-        # Make page number clickable to TOC
-        if self.include_toc:
-            dot_page_num = display_page_num
-            if dot_page_num in self.toc_page_map:
-                link_rect = (x_pos - 2, y_pos - 2, x_pos + text_width + 2, y_pos + font_size)
-                c.linkRect("", self.toc_page_map[dot_page_num], link_rect, relative=0)
+
+        # The font and color are identical on every page, so emit the text
+        # as one prebuilt operator string instead of per-page setFont /
+        # setFillColorRGB / drawString calls. The q/Q pair keeps the grey
+        # fill out of the surrounding graphics state.
+        prefix = self._pageno_prefix
+        if prefix is None:
+            internal_font = c._doc.getInternalFontName(self.font_name)
+            prefix = self._pageno_prefix = (
+                'q BT %s %d Tf 0.55 0.55 0.55 rg' % (internal_font, font_size))
+        c._code.append('%s 1 0 0 1 %.2f %.2f Tm (%s) Tj ET Q'
+                       % (prefix, x_pos, y_pos, page_num_text))
+
+        # Make page number clickable to TOC. Pages without a TOC entry have
+        # a None target, so the rectangle construction and link machinery
+        # are skipped entirely for them (and for documents with no TOC).
+        target = self._page_link_targets[display_page_num]
+        if target:
+            link_rect = (x_pos - 2, y_pos - 2, x_pos + text_width + 2, y_pos + font_size)
+            c.linkRect("", target, link_rect, relative=0)
     
     def _create_content_pages(self):
         """Create all content pages."""
         c = self.canvas
-        
-        for page in range(self.num_pages):
-            dot_page_num = page + 1
-            display_page_num = page + 1
-            
-            c.bookmarkPage(f"page_{dot_page_num}")
-            c.bookmarkPage(f"page_num_{self.actual_page_num}")
-            
-            self._draw_page_pattern()
-            self._add_page_number(display_page_num)
-            
-            if page < self.num_pages - 1:
+        has_pattern_form = self._create_pattern_form()
+
+        def draw_page(page_num):
+            # Only the page_{n} destination is ever linked to (by the TOC
+            # entries); the page_num_{n} destinations are used for the
+            # title/TOC navigation chain and are not needed on content pages.
+            c.bookmarkPage(f"page_{page_num}")
+
+            if has_pattern_form:
+                c.doForm(self.PATTERN_FORM_NAME)
+            self._add_page_number(page_num)
+
+        if self.num_pages:
+            # Every page except the last is followed by a page break, so
+            # draw the final page outside the loop and keep both the break
+            # branch and the page-counter update out of the hot path.
+            for page_num in range(1, self.num_pages):
+                draw_page(page_num)
                 c.showPage()
-                self.actual_page_num += 1
+            draw_page(self.num_pages)
+            self.actual_page_num += self.num_pages - 1
     
     def _print_summary(self):
-        """Print generation summary."""
-        total_pages = self.num_pages
+        """Print generation summary.
+
+        The summary is assembled as a list of lines and written to stdout
+        in one call so a batch run issues one write per PDF instead of a
+        dozen line-buffered prints.
+        """
+        num_toc_pages = self._calculate_toc_pages() if self.include_toc else 0
+        total_pages = self.num_pages + num_toc_pages
         if self.include_title_page:
             total_pages += 1
-        if self.include_toc:
-            num_toc_pages = self._calculate_toc_pages()
-            total_pages += num_toc_pages
-        
-        print(f"PDF created: {self.filename}")
-        print(f"  - Content pages: {self.num_pages}")
+
+        lines = [f"PDF created: {self.filename}",
+                 f"  - Content pages: {self.num_pages}"]
         if self.include_title_page:
-            print(f"  - Title page: Yes")
+            lines.append("  - Title page: Yes")
         if self.include_toc:
-            num_toc_pages = self._calculate_toc_pages()
-            print(f"  - Table of Contents: Yes ({num_toc_pages} page(s))")
-        print(f"  - Total pages in PDF: {total_pages}")
-        print(f"  - Page pattern: {self.page_pattern}")
+            lines.append(f"  - Table of Contents: Yes ({num_toc_pages} page(s))")
+        lines.append(f"  - Total pages in PDF: {total_pages}")
+        lines.append(f"  - Page pattern: {self.page_pattern}")
         if self.page_pattern in ['dots', 'lines', 'grid']:
-            print(f"  - Pattern spacing: {self.spacing_mm}mm")
-        print(f"  - Page size: {self.page_width/mm:.1f}mm x {self.page_height/mm:.1f}mm")
-        print(f"  - Margins: L={self.left_margin_mm}mm, R={self.right_margin_mm}mm, "
-              f"T={self.top_margin_mm}mm, B={self.bottom_margin_mm}mm")
-        print(f"  - Page number position: "
-              f"{self.page_number_position if self.page_number_position else 'None'}")
-        print(f"  - Font used: {self.font_name}")
+            lines.append(f"  - Pattern spacing: {self.spacing_mm}mm")
+        lines.append(f"  - Page size: {self.page_width/mm:.1f}mm x "
+                     f"{self.page_height/mm:.1f}mm")
+        lines.append(f"  - Margins: L={self.left_margin_mm}mm, R={self.right_margin_mm}mm, "
+                     f"T={self.top_margin_mm}mm, B={self.bottom_margin_mm}mm")
+        lines.append(f"  - Page number position: "
+                     f"{self.page_number_position if self.page_number_position else 'None'}")
+        lines.append(f"  - Font used: {self.font_name}")
         if self.serif_font_embedded:
-            print(f"  - Serif font used: {self.serif_font_name} (embedded in PDF)")
+            lines.append(f"  - Serif font used: {self.serif_font_name} (embedded in PDF)")
         else:
-            print(f"  - Serif font used: {self.serif_font_name} (fallback)")
+            lines.append(f"  - Serif font used: {self.serif_font_name} (fallback)")
+        sys.stdout.write("\n".join(lines) + "\n")
     
-    def generate(self):
-        """
-        Generate the PDF notebook.
-        
-        This is the main method that orchestrates the PDF creation process.
-        """
+    def render(self):
+        """Draw the title page, TOC and content pages onto the canvas."""
         # Create title page if requested
         if self.include_title_page:
             self._create_title_page()
-        
+
         # Create table of contents if requested
         if self.include_toc:
             self._create_toc()
-        
+
         # Create content pages
         self._create_content_pages()
-        
-        # Save the PDF
-        self.canvas.save()
-        
+
+    def save(self):
+        """Serialize the rendered document and close our output handle.
+
+        Kept separate from render() so batch runs can overlap the final
+        zlib compression and file writes — which release the GIL — with
+        rendering the next notebook.
+        """
+        try:
+            self.canvas.save()
+        finally:
+            # Close our own handle even on failure so batch runs don't leak
+            # file descriptors; caller-provided file objects stay open.
+            if self._owns_output:
+                self._output.close()
+
+    def generate(self):
+        """
+        Generate the PDF notebook.
+
+        This is the main method that orchestrates the PDF creation process.
+        """
+        try:
+            self.render()
+        except Exception:
+            if self._owns_output:
+                self._output.close()
+            raise
+        self.save()
+
         # Print summary
         self._print_summary()
 
 
+def _batch_worker(device, pattern, output_file, generator_kwargs):
+    """Generate one notebook PDF; used as a multiprocessing worker.
+
+    Lives at module level so it can be pickled. Returns a tuple of
+    (output_file, error_message_or_None) for the parent to aggregate.
+    """
+    try:
+        generator = PDFHyperlinkedNotebookGenerator(
+            filename=output_file,
+            page_size=device,
+            page_pattern=pattern,
+            **generator_kwargs
+        )
+        generator.generate()
+        return output_file, None
+    except Exception as e:
+        return output_file, str(e)
+
+
 class PDFNotebookBatchGenerator:
     """
     A class for generating multiple PDF notebooks in batch.
@@ -914,9 +1251,9 @@ class PDFNotebookBatchGenerator:
         self.include_toc = include_toc
         self.output_dir = output_dir if output_dir is not None else ""
         
-        # Create output directory if specified and doesn't exist
-        if self.output_dir and not os.path.exists(self.output_dir):
-            os.makedirs(self.output_dir)
+        # Create output directory if specified
+        if self.output_dir:
+            os.makedirs(self.output_dir, exist_ok=True)
         
         # Statistics
         self.generated_count = 0
@@ -938,10 +1275,10 @@ class PDFNotebookBatchGenerator:
         --------
         str : Output filename
         """
-        device_display = PDFHyperlinkedNotebookGenerator.DEVICE_DISPLAY_NAMES.get(
-            device, device
-        )
-        pattern_display = self.PATTERN_DISPLAY_NAMES.get(pattern, pattern)
+        device_names = PDFHyperlinkedNotebookGenerator.DEVICE_DISPLAY_NAMES
+        pattern_names = self.PATTERN_DISPLAY_NAMES
+        device_display = device_names.get(device, device)
+        pattern_display = pattern_names.get(pattern, pattern)
         filename = f"{device_display} - {pattern_display}.pdf"
         
         if self.output_dir:
@@ -949,6 +1286,19 @@ class PDFNotebookBatchGenerator:
         
         return filename
     
+    def _generator_kwargs(self):
+        """Shared PDFHyperlinkedNotebookGenerator kwargs for this batch."""
+        return {
+            'num_pages': self.num_pages,
+            'page_number_position': self.page_number_position,
+            'margins': self.margins,
+            'spacing_mm': self.spacing_mm,
+            'dot_radius': self.dot_radius,
+            'toc_line_spacing_mm': self.toc_line_spacing_mm,
+            'include_title_page': self.include_title_page,
+            'include_toc': self.include_toc,
+        }
+
     def generate_single(self, device, pattern, verbose=True):
         """
         Generate a single PDF for a device and pattern.
@@ -976,16 +1326,9 @@ class PDFNotebookBatchGenerator:
         try:
             generator = PDFHyperlinkedNotebookGenerator(
                 filename=output_file,
-                num_pages=self.num_pages,
                 page_size=device,
-                page_number_position=self.page_number_position,
-                margins=self.margins,
-                spacing_mm=self.spacing_mm,
-                dot_radius=self.dot_radius,
-                toc_line_spacing_mm=self.toc_line_spacing_mm,
-                include_title_page=self.include_title_page,
-                include_toc=self.include_toc,
-                page_pattern=pattern
+                page_pattern=pattern,
+                **self._generator_kwargs()
             )
             generator.generate()
             self.generated_count += 1
@@ -997,15 +1340,90 @@ class PDFNotebookBatchGenerator:
                 print(f"ERROR: Failed to generate {output_file}: {e}")
             return False
     
-    def generate_all(self, verbose=True):
+    def iter_generate_all(self, verbose=True):
+        """
+        Generate all PDFs sequentially, yielding each result as it finishes.
+
+        A streaming alternative to generate_all for callers that want
+        per-file progress (UIs, logging) without holding the whole result
+        set in memory. Saving runs on a single helper thread so the
+        compression and file writes of one notebook overlap with rendering
+        the next.
+
+        Yields:
+        -------
+        tuple : (device, pattern, ok, error) per combination, where error
+            is None on success
+        """
+        def finish(item):
+            device, pattern, output_file, generator, future, error = item
+            if error is None and future is not None:
+                try:
+                    future.result()
+                except Exception as e:
+                    error = str(e)
+            if error is None:
+                self.generated_count += 1
+                if verbose:
+                    generator._print_summary()
+            else:
+                self.failed_count += 1
+                self.failed_files.append((output_file, error))
+                if verbose:
+                    print(f"ERROR: Failed to generate {output_file}: {error}")
+            return device, pattern, error is None, error
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as saver:
+            pending = None
+            for device in self.devices:
+                for pattern in self.patterns:
+                    output_file = self.get_output_filename(device, pattern)
+                    if verbose:
+                        print(f"\n{'='*60}")
+                        print(f"Generating {os.path.basename(output_file)}...")
+                        print(f"{'='*60}")
+
+                    generator = None
+                    future = None
+                    error = None
+                    try:
+                        generator = PDFHyperlinkedNotebookGenerator(
+                            filename=output_file,
+                            page_size=device,
+                            page_pattern=pattern,
+                            **self._generator_kwargs()
+                        )
+                        generator.render()
+                    except Exception as e:
+                        error = str(e)
+                        if generator is not None and generator._owns_output:
+                            generator._output.close()
+                    else:
+                        future = saver.submit(generator.save)
+
+                    if pending is not None:
+                        yield finish(pending)
+                    pending = (device, pattern, output_file, generator,
+                               future, error)
+            if pending is not None:
+                yield finish(pending)
+
+    def generate_all(self, verbose=True, parallel=True, num_workers=None):
         """
         Generate all PDFs for all device and pattern combinations.
-        
+
         Parameters:
         -----------
         verbose : bool
             Whether to print progress (default: True)
-            
+        parallel : bool
+            Whether to generate PDFs in parallel across CPU cores; each
+            (device, pattern) combination is independent. Pass False for
+            sequential generation, e.g. when debugging (default: True)
+        num_workers : int, optional
+            Number of worker processes for parallel generation
+            (default: one per CPU core, capped at the number of PDFs)
+
         Returns:
         --------
         dict : Statistics about the generation process
@@ -1014,25 +1432,45 @@ class PDFNotebookBatchGenerator:
         self.generated_count = 0
         self.failed_count = 0
         self.failed_files = []
-        
+
         total = len(self.devices) * len(self.patterns)
+
+        if parallel and total > 1:
+            if num_workers is None:
+                num_workers = min(os.cpu_count() or 1, total)
+            tasks = [
+                (device, pattern, self.get_output_filename(device, pattern),
+                 self._generator_kwargs())
+                for device in self.devices
+                for pattern in self.patterns
+            ]
+            with concurrent.futures.ProcessPoolExecutor(max_workers=num_workers) as pool:
+                futures = [pool.submit(_batch_worker, *task) for task in tasks]
+                for future in concurrent.futures.as_completed(futures):
+                    output_file, error = future.result()
+                    if error is None:
+                        self.generated_count += 1
+                    else:
+                        self.failed_count += 1
+                        self.failed_files.append((output_file, error))
+        else:
+            for _ in self.iter_generate_all(verbose=verbose):
+                pass
         
-        for device in self.devices:
-            for pattern in self.patterns:
-                self.generate_single(device, pattern, verbose=verbose)
-        
-        # Print summary
+        # Print summary as one buffered write, matching _print_summary
         if verbose:
-            print(f"\n{'='*60}")
-            print(f"Batch Generation Complete!")
-            print(f"{'='*60}")
-            print(f"  - Successfully generated: {self.generated_count}/{total}")
+            bar = '=' * 60
+            lines = [f"\n{bar}",
+                     "Batch Generation Complete!",
+                     bar,
+                     f"  - Successfully generated: {self.generated_count}/{total}"]
             if self.failed_count > 0:
-                print(f"  - Failed: {self.failed_count}")
-                print(f"\nFailed files:")
-                for filename, error in self.failed_files:
-                    print(f"  - {filename}: {error}")
-            print(f"{'='*60}")
+                lines.append(f"  - Failed: {self.failed_count}")
+                lines.append("\nFailed files:")
+                lines.extend(f"  - {filename}: {error}"
+                             for filename, error in self.failed_files)
+            lines.append(bar)
+            sys.stdout.write("\n".join(lines) + "\n")
         
         return {
             'total': total,